@@ -1,20 +1,67 @@
+import os
+
+from . import formatters
 from .meta import SingletonMeta
 
 
+class _Node:
+    __slots__ = ("children", "terminal")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        self.terminal = False
+
+
+class _PathTrie:
+    """
+    Prefix tree of path segments used to answer allowed-path lookups
+    in O(depth) regardless of how many roots are registered. Matching whole
+    segments means /foo/bar allows /foo/bar/baz but not /foo/barbaz.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        # Segment count of the deepest inserted path
+        self._depth = 0
+
+    @staticmethod
+    def _split(path: str, maxsplit: int = -1) -> list[str]:
+        return path.rstrip(os.sep).split(os.sep, maxsplit)
+
+    def insert(self, path: str):
+        segments = self._split(path)
+        self._depth = max(self._depth, len(segments))
+        node = self._root
+        for segment in segments:
+            node = node.children.setdefault(segment, _Node())
+        node.terminal = True
+
+    def contains_prefix(self, path: str) -> bool:
+        node = self._root
+        # Segments past the deepest inserted path are never inspected
+        for segment in self._split(path, self._depth):
+            node = node.children.get(segment)
+            if node is None:
+                return False
+            if node.terminal:
+                return True
+        return False
+
+
 class ServerConfig(metaclass=SingletonMeta):
     __allowed_paths = []
+    __allowed_trie = _PathTrie()
 
     def include_allowed_paths(self, allowed_paths:list[str]):
-        self.__allowed_paths.extend(allowed_paths)
-    
+        for path in allowed_paths:
+            self.allow_path(path)
+
     def allow_path(self, path:str):
         self.__allowed_paths.append(path)
-    
+        self.__allowed_trie.insert(formatters.normalize_path(path))
+
     def get_allowed_paths(self)->list[str]:
         return self.__allowed_paths
-    
-    def is_allowed_path(self, path:str)->bool:
-        return any(path.startswith(d) for d in self.__allowed_paths)
-
 
-    
+    def is_allowed_path(self, path:str)->bool:
+        return self.__allowed_trie.contains_prefix(path)
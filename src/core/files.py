@@ -0,0 +1,57 @@
+import mmap
+import os
+
+# Read size used once the size reported by fstat has been consumed
+_READ_CHUNK = 1024 * 1024
+# Files at least this large are decoded straight from a memory map
+_MMAP_THRESHOLD = 16 * 1024 * 1024
+
+
+def _normalize_newlines(text: str) -> str:
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _read_mapped(fd: int) -> str:
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        has_cr = mapped.find(b"\r") != -1
+        # Decode from the mapped pages without copying them into bytes first
+        with memoryview(mapped) as view:
+            content = str(view, "utf-8")
+    return _normalize_newlines(content) if has_cr else content
+
+
+def _read_chunks(fd: int, size: int) -> str:
+    chunks = []
+    # One byte past the reported size lets a regular file finish in a
+    # single read; files reporting no size fall back to fixed chunks
+    chunk_size = size + 1
+    while chunk := os.read(fd, chunk_size):
+        chunks.append(chunk)
+        chunk_size = _READ_CHUNK
+
+    raw = b"".join(chunks)
+    if b"\r" in raw:
+        raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return raw.decode("utf-8")
+
+
+def read_text(path: str) -> str:
+    """
+    Read a whole UTF-8 text file, translating line endings to \n
+    as text-mode open() does.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        if size >= _MMAP_THRESHOLD:
+            return _read_mapped(fd)
+        return _read_chunks(fd, size)
+    except OSError as e:
+        # Errors from the descriptor carry no file name, unlike open()'s
+        if e.filename is not None:
+            raise
+        raise OSError(e.errno, e.strerror, path) from e
+    finally:
+        os.close(fd)
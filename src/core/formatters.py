@@ -1,41 +1,98 @@
+import functools
 import os
 import re
 
+_HOME_DIR = os.path.expanduser("~")
+_BLANK_RUN_RE = re.compile(r"[ \t]+")
+# Caches in other modules that memoize expand_home or normalize_path results
+_dependent_caches = []
+
 
 def normalize_line_endings(text: str) -> str:
     """
     Normalize line endings in a string to Unix-style (\n).
     """
+    if "\r" not in text:
+        return text
     return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
 def normalize_whitespace(text: str) -> str:
     """Normalize whitespace while preserving overall structure."""
-    # Collapse multiple spaces into one
-    result = re.sub(r"[ \t]+", " ", text)
-    # Trim whitespace at line beginnings and endings
-    result = "\n".join(line.strip() for line in result.split("\n"))
-    return result
+    lines = text.split("\n")
+    for i, line in enumerate(lines):
+        # Trim whitespace at line beginnings and endings
+        line = line.strip()
+        # Collapse multiple spaces into one, only where there is something to do
+        if "  " in line or "\t" in line:
+            line = _BLANK_RUN_RE.sub(" ", line)
+        lines[i] = line
+    return "\n".join(lines)
 
 
 def get_line_indentation(line: str) -> str:
     """Extract the indentation (leading whitespace) from a line."""
-    match = re.match(r"^(\s*)", line)
-    return match.group(1) if match else ""
+    return line[: len(line) - len(line.lstrip())]
 
 
+@functools.lru_cache(maxsize=4096)
 def expand_home(path: str) -> str:
     """
     Expand the user's home directory in a given path.
     """
+    if path == "~":
+        return _HOME_DIR
+    if path.startswith("~" + os.sep):
+        # Like expanduser, drop the home's trailing separator so HOME=/
+        # yields /x rather than //x
+        return (_HOME_DIR.rstrip(os.sep) + path[1:]) or os.sep
     if path.startswith("~"):
         return os.path.expanduser(path)
     return path
 
 
+def _is_normalized(path: str) -> bool:
+    """Tell whether normpath would return the path unchanged."""
+    if not path:
+        return False
+    if path == os.sep:
+        return True
+    if os.altsep and os.altsep in path:
+        return False
+    if path.endswith(os.sep) or os.sep * 2 in path:
+        return False
+    if "." not in path:
+        return True
+    return all(part not in (".", "..") for part in path.split(os.sep))
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_path(path: str) -> str:
     """
     Normalize a file path by expanding the user's home directory
     and normalizing line endings.
     """
+    if _is_normalized(path):
+        return path
     return os.path.normpath(path)
+
+
+def register_path_cache(cached_function):
+    """
+    Have clear_path_caches also clear an lru_cache built on these helpers.
+    """
+    _dependent_caches.append(cached_function)
+    return cached_function
+
+
+def clear_path_caches():
+    """
+    Drop the memoized results of expand_home, normalize_path and every
+    cache registered with register_path_cache.
+    """
+    global _HOME_DIR
+    _HOME_DIR = os.path.expanduser("~")
+    expand_home.cache_clear()
+    normalize_path.cache_clear()
+    for cached_function in _dependent_caches:
+        cached_function.cache_clear()
@@ -1,19 +1,37 @@
+import functools
 import os
+import stat
 
 from . import formatters
 from .config import ServerConfig
 
 
-def is_valid_dir(dir_path: str):
-    if not os.path.isdir(dir_path):
+def stat_once(path: str, follow_symlinks=True) -> os.stat_result | None:
+    """Stat a path, returning None when it cannot be reached."""
+    try:
+        return os.stat(path, follow_symlinks=follow_symlinks)
+    except (OSError, ValueError):
+        return None
+
+def is_valid_dir(dir_path: str, dir_stat: os.stat_result | None = None):
+    if dir_stat is None:
+        dir_stat = stat_once(dir_path)
+    if dir_stat is None or not stat.S_ISDIR(dir_stat.st_mode):
         raise NotADirectoryError(f"{dir_path} is not a valid directory or not exists.")
 
-def path_exists(path:str):
-    if not os.path.exists(path):
+def path_exists(path:str, path_stat: os.stat_result | None = None):
+    if path_stat is None and stat_once(path) is None:
         raise FileExistsError(f"Path not exists:{path}")
 
 def validate_symlink(link_path):
-    real_path = os.path.realpath(link_path)
+    absolute_link = os.path.abspath(link_path)
+    # Check the link itself before following it
+    link_stat = os.lstat(absolute_link)
+    __validate_absolute_path(absolute_link)
+    if not stat.S_ISLNK(link_stat.st_mode):
+        return absolute_link
+
+    real_path = os.path.realpath(absolute_link)
     normalized_real = formatters.normalize_path(real_path)
     is_real_allowed  = ServerConfig().is_allowed_path(normalized_real)
     if not is_real_allowed:
@@ -30,20 +48,34 @@ def __validate_absolute_path(absolute_path):
             f"Access denied - path outside allowed directories: {absolute_path}"
         )
 
-def validate_path(path:str, validate_parent=False):
+@formatters.register_path_cache
+@functools.lru_cache(maxsize=1024)
+def _absolute_path(path: str, cwd: str | None) -> str:
     expanded_path = formatters.expand_home(path)
-    absolute_path = os.path.abspath(expanded_path)
-    try:
-        path_exists(absolute_path)
-    except FileExistsError:
+    if cwd is not None:
+        expanded_path = os.path.join(cwd, expanded_path)
+    return formatters.normalize_path(expanded_path)
+
+def validate_path(path:str, validate_parent=False):
+    # Only relative paths depend on the working directory; filesystem checks
+    # below are never cached so a path swapped for a symlink is caught
+    is_absolute = os.path.isabs(formatters.expand_home(path))
+    absolute_path = _absolute_path(path, None if is_absolute else os.getcwd())
+    path_stat = stat_once(absolute_path, follow_symlinks=False)
+    is_link = path_stat is not None and stat.S_ISLNK(path_stat.st_mode)
+    if is_link:
+        # A symlink only exists if its target does
+        path_stat = stat_once(absolute_path)
+
+    if path_stat is None:
         if not validate_parent:
-            raise
+            raise FileExistsError(f"Path not exists:{absolute_path}")
         # If the file does not exist yet, we validate its parent directory
         __validate_absolute_path(os.path.dirname(absolute_path))
         return absolute_path
 
-    if os.path.islink(absolute_path):
-        return validate_symlink(path)
+    if is_link:
+        return validate_symlink(absolute_path)
 
     __validate_absolute_path(absolute_path)
     
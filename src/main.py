@@ -1,6 +1,7 @@
 import logging
 import os
 import sys
+from collections.abc import Callable
 
 from mcp.server.fastmcp import FastMCP
 
@@ -12,6 +13,22 @@ _log = logging.getLogger()
 # Define the MCP server
 server = FastMCP(name="file-reader-server", version="1.0.0")
 
+# Each tool class builds its own name, description and schema
+_TOOL_CLASSES: tuple[Callable[[], types.BaseTool], ...] = (
+    tools.ReadFileTool,
+    tools.ReadMultipleFilesTool,
+    tools.WriteFileTool,
+    tools.EditFileTool,
+    tools.CreateDirectoryTool,
+    tools.ListDirectoryTool,
+    tools.ListDirectoryWithSizeTool,
+    tools.DirectoryTreeTool,
+    tools.MoveFileTool,
+    tools.SearchFilesTool,
+    tools.GetFileInfoTool,
+    tools.GetAllowedPathsTool,
+)
+
 def config_server():
     path_args = sys.argv[1:]
 
@@ -22,27 +39,15 @@ def config_server():
     server_config = config.ServerConfig()
     for path in path_args:
         expanded_path = formatters.expand_home(path)
-        validations.path_exists(expanded_path)
-        validations.is_valid_dir(expanded_path)
+        path_stat = validations.stat_once(expanded_path)
+        validations.path_exists(expanded_path, path_stat)
+        validations.is_valid_dir(expanded_path, path_stat)
         norm_path = formatters.normalize_path(expanded_path)
         server_config.allow_path(norm_path)
 
 def register_tools():
-    tools_list: list[types.BaseTool]   = [
-        tools.ReadFileTool(),
-        tools.ReadMultipleFilesTool(),
-        tools.WriteFileTool(),
-        tools.EditFileTool(),
-        tools.CreateDirectoryTool(),
-        tools.ListDirectoryTool(),
-        tools.ListDirectoryWithSizeTool(),
-        tools.DirectoryTreeTool(),
-        tools.MoveFileTool(),
-        tools.SearchFilesTool(),
-        tools.GetFileInfoTool(),
-        tools.GetAllowedPathsTool(),
-    ]
-    for tool in tools_list:
+    for tool_class in _TOOL_CLASSES:
+        tool = tool_class()
         server.add_tool(
             fn=tool.callback(),
             name=tool.name,
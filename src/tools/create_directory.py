@@ -18,6 +18,8 @@ class CreateDirectoryInput(BaseModel):
     ]
 
 
+_INPUT_SCHEMA = CreateDirectoryInput.model_json_schema()
+
 TOOL_DESCRIPTION = f"""
     Create a new directory or ensure a directory exists. Can create multiple
     directories at once. If the directory already exists, this operation will succeed 
@@ -27,14 +29,14 @@ TOOL_DESCRIPTION = f"""
         input: The path to the file to read.
     @Output:
         text: Success or error message .
-    @Schema: {CreateDirectoryInput.model_json_schema()}
+    @Schema: {_INPUT_SCHEMA}
 """
 
 
 class CreateDirectoryTool(BaseTool):
     def __init__(self):
         super().__init__(
-            inputSchema=CreateDirectoryInput.model_json_schema(),
+            inputSchema=_INPUT_SCHEMA,
             name=FileSystemTools.CREATE_DIRECTORY.value,
             description=TOOL_DESCRIPTION,
         )
@@ -14,11 +14,7 @@ class DirectoryTreeInput(BaseModel):
     path: Annotated[str, AfterValidator(validate_path)]
 
 
-class TreeEntry(BaseModel):
-    file_name: str
-    type: str
-    children: list["TreeEntry"] = []
-
+_INPUT_SCHEMA = DirectoryTreeInput.model_json_schema()
 
 TOOL_DESCRIPTION = f"""
     Get a recursive tree view of files and directories as a JSON structure.
@@ -30,38 +26,41 @@ TOOL_DESCRIPTION = f"""
         path: The path to the file to read.
     @Output:
         text: text with directory tree
-    @Schema: {DirectoryTreeInput.model_json_schema()}
+    @Schema: {_INPUT_SCHEMA}
 """
 
 
 class DirectoryTreeTool(BaseTool):
     def __init__(self):
         super().__init__(
-            inputSchema=DirectoryTreeInput.model_json_schema(),
+            inputSchema=_INPUT_SCHEMA,
             name=FileSystemTools.DIRECTORY_TREE.value,
             description=TOOL_DESCRIPTION,
         )
 
-    def _validate_path(self, path: str):
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"Path not found: {path}")
-        return os.path.abspath(path)
-
-    def _build_tree(self, current_path) -> list[TreeEntry]:
-        valid_path = self._validate_path(current_path)
-
+    def _build_tree(self, root_path: str) -> list[dict]:
         result = []
-        with os.scandir(valid_path) as entries:
-            for entry in entries:
-                entry_data = TreeEntry(
-                    file_name=entry.name,
-                    type="directory" if entry.is_dir() else "file",
-                )
-
-                if entry.is_dir():
-                    sub_path = os.path.join(current_path, entry.name)
-                    entry_data.children.extend(self._build_tree(sub_path))
-                result.append(entry_data)
+        # Directories still to scan, each with the list its entries go into
+        stack = [(root_path, result)]
+        while stack:
+            current_path, children = stack.pop()
+            with os.scandir(current_path) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        children.append({"file_name": entry.name, "type": "file"})
+                        continue
+
+                    dir_children = []
+                    children.append(
+                        {
+                            "file_name": entry.name,
+                            "type": "directory",
+                            "children": dir_children,
+                        }
+                    )
+                    # Do not descend through symlinks
+                    if not entry.is_symlink():
+                        stack.append((entry.path, dir_children))
 
         return result
 
@@ -69,8 +68,5 @@ class DirectoryTreeTool(BaseTool):
         tree_data = self._build_tree(input.path)
         return TextContent(
             type="text",
-            text=json.dumps(
-                [entry.model_dump(exclude_defaults=True) for entry in tree_data],
-                indent=2,
-            ),
+            text=json.dumps(tree_data, indent=2),
         )
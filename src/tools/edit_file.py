@@ -1,10 +1,14 @@
+import bisect
 import difflib
+import io
+import os
 from typing import Annotated
 
 from mcp.types import TextContent
 from pydantic import AfterValidator, BaseModel, Field, ConfigDict
 
 from core.enums import FileSystemTools
+from core.files import read_text
 from core.formatters import get_line_indentation, normalize_line_endings
 from core.types import BaseTool
 from core.validations import validate_path
@@ -49,6 +53,8 @@ class MatchResult(BaseModel):
     line_count: int = 0
     details: str = ""
     match_type: str
+    # Offset of the match in the searched content, kept out of the output
+    _start_pos: int = -1
 
 
 class EditFileOutput(BaseModel):
@@ -60,6 +66,8 @@ class EditFileOutput(BaseModel):
     diff: str = ""
 
 
+_INPUT_SCHEMA = EditFileInput.model_json_schema()
+
 TOOL_DESCRIPTION = f"""
     Edits a file on the filesystem by replacing specified text with new text.
     @Input:
@@ -68,14 +76,34 @@ TOOL_DESCRIPTION = f"""
         dry_run: If true, preview changes using git-style diff format.
     @Output:
         text: A string containing the diff of the changes made to the file.
-    @Schema: {EditFileInput.model_json_schema()}
+    @Schema: {_INPUT_SCHEMA}
 """
 
 
+# Lines of unchanged context shown around each diff hunk
+_DIFF_CONTEXT = 3
+
+
+def _split_lines(text: str) -> list[str]:
+    """Split text on newlines, keeping the line endings."""
+    # With newline="\n" lines end only at "\n", unlike str.splitlines
+    return io.StringIO(text, newline="\n").readlines()
+
+
+def _format_hunk_range(start: int, stop: int) -> str:
+    """Format a 0-based line range the way unified diff hunk headers expect."""
+    length = stop - start
+    if length == 1:
+        return f"{start + 1}"
+    if not length:
+        return f"{start},0"
+    return f"{start + 1},{length}"
+
+
 class EditFileTool(BaseTool):
     def __init__(self):
         super().__init__(
-            inputSchema=EditFileInput.model_json_schema(),
+            inputSchema=_INPUT_SCHEMA,
             name=FileSystemTools.EDIT_FILE.value,
             description=TOOL_DESCRIPTION,
         )
@@ -87,10 +115,11 @@ class EditFileTool(BaseTool):
         edit_index: int,
     ) -> MatchResult:
         """Find an exact string match in the content."""
-        if pattern in content:
-            lines_before = content[: content.find(pattern)].count("\n")
+        start_pos = content.find(pattern)
+        if start_pos != -1:
+            lines_before = content.count("\n", 0, start_pos)
             line_count = pattern.count("\n") + 1
-            return MatchResult(
+            match_result = MatchResult(
                 matched=True,
                 edit_index=edit_index,
                 line_index=lines_before,
@@ -98,6 +127,8 @@ class EditFileTool(BaseTool):
                 match_type="success",
                 details="Exact match found",
             )
+            match_result._start_pos = start_pos
+            return match_result
         return MatchResult(
             matched=False,
             edit_index=edit_index,
@@ -105,18 +136,110 @@ class EditFileTool(BaseTool):
             details="No exact match found",
         )
 
-    def create_unified_diff(self, original: str, modified: str, file_path: str) -> str:
-        """Create a unified diff between original and modified content."""
-        original_lines = original.splitlines(True)
-        modified_lines = modified.splitlines(True)
-
-        diff_lines = difflib.unified_diff(
-            original_lines,
-            modified_lines,
-            fromfile=f"a/{file_path}",
-            tofile=f"b/{file_path}",
-            lineterm="",
+    def create_unified_diff(
+        self,
+        original: str,
+        modified: str,
+        file_path: str,
+        unchanged_prefix: int = 0,
+        unchanged_suffix: int = 0,
+    ) -> str:
+        """Create a unified diff between original and modified content.
+
+        unchanged_prefix and unchanged_suffix are the number of leading and
+        trailing characters known to be identical in both texts. Only the lines
+        around the changed region are split and compared.
+        """
+        # Widen the changed region to whole lines plus the hunk context
+        window_start = original.rfind("\n", 0, unchanged_prefix) + 1
+        for _ in range(_DIFF_CONTEXT):
+            if window_start == 0:
+                break
+            window_start = original.rfind("\n", 0, window_start - 1) + 1
+
+        window_end = len(original) - unchanged_suffix
+        for _ in range(_DIFF_CONTEXT + 1):
+            window_end = original.find("\n", window_end) + 1
+            if window_end == 0:
+                window_end = len(original)
+                break
+        tail_len = len(original) - window_end
+
+        original_lines = _split_lines(original[window_start:window_end])
+        modified_lines = _split_lines(
+            modified[window_start : len(modified) - tail_len]
+        )
+        line_offset = original.count("\n", 0, window_start)
+
+        # Lines shared at both ends of the window are only context; handing
+        # them to the matcher lets it pair them with lookalikes inside the change
+        limit = min(len(original_lines), len(modified_lines))
+        head = 0
+        while head < limit and original_lines[head] == modified_lines[head]:
+            head += 1
+        tail = 0
+        while (
+            tail < limit - head
+            and original_lines[-1 - tail] == modified_lines[-1 - tail]
+        ):
+            tail += 1
+        original_end = len(original_lines) - tail
+        modified_end = len(modified_lines) - tail
+
+        # Keep difflib's junk heuristic: it only engages from 200 lines on,
+        # where windows full of repeated lines would otherwise make the
+        # alignment quadratic
+        matcher = difflib.SequenceMatcher(
+            None,
+            original_lines[head:original_end],
+            modified_lines[head:modified_end],
         )
+        groups = [
+            [
+                (tag, i1 + head, i2 + head, j1 + head, j2 + head)
+                for tag, i1, i2, j1, j2 in group
+            ]
+            for group in matcher.get_grouped_opcodes(_DIFF_CONTEXT)
+        ]
+        if groups:
+            # The changed lines start right after head and end right before
+            # tail, so the outer context comes from the shared lines
+            context = min(head, _DIFF_CONTEXT)
+            groups[0].insert(
+                0, ("equal", head - context, head, head - context, head)
+            )
+            context = min(tail, _DIFF_CONTEXT)
+            groups[-1].append(
+                (
+                    "equal",
+                    original_end,
+                    original_end + context,
+                    modified_end,
+                    modified_end + context,
+                )
+            )
+
+        diff_lines = []
+        for group in groups:
+            if not diff_lines:
+                diff_lines.append(f"--- a/{file_path}")
+                diff_lines.append(f"+++ b/{file_path}")
+            first, last = group[0], group[-1]
+            old_range = _format_hunk_range(
+                first[1] + line_offset, last[2] + line_offset
+            )
+            new_range = _format_hunk_range(
+                first[3] + line_offset, last[4] + line_offset
+            )
+            diff_lines.append(f"@@ -{old_range} +{new_range} @@")
+            for tag, i1, i2, j1, j2 in group:
+                if tag == "equal":
+                    diff_lines.extend(" " + line for line in original_lines[i1:i2])
+                    continue
+                if tag in ("replace", "delete"):
+                    diff_lines.extend("-" + line for line in original_lines[i1:i2])
+                if tag in ("replace", "insert"):
+                    diff_lines.extend("+" + line for line in modified_lines[j1:j2])
 
         return "".join(diff_lines)
 
@@ -140,43 +263,43 @@ class EditFileTool(BaseTool):
         if not old_lines or not new_lines:
             return new_text
 
-        # Extract the base indentation from the first line of old text
-        base_indent = (
-            get_line_indentation(old_lines[0])
-            if old_lines and old_lines[0].strip()
-            else ""
-        )
+        # Pre-calculate indentation per line; None marks blank lines
+        old_indents = [
+            get_line_indentation(line) if line.strip() else None
+            for line in old_lines
+        ]
+        new_indents = [
+            get_line_indentation(line) if line.strip() else None
+            for line in new_lines
+        ]
 
-        # Pre-calculate indentation maps for efficiency
-        old_indents = {
-            i: get_line_indentation(line)
-            for i, line in enumerate(old_lines)
-            if line.strip()
-        }
-        new_indents = {
-            i: get_line_indentation(line)
-            for i, line in enumerate(new_lines)
-            if line.strip()
-        }
+        # Extract the base indentation from the first line of old text
+        base_indent = old_indents[0] or ""
 
         # Calculate first line indentation length for relative adjustments
-        first_new_indent_len = len(new_indents.get(0, "")) if new_indents else 0
+        first_new_indent_len = len(new_indents[0] or "")
+
+        # Previous lines usable as indentation templates, kept ordered by line
+        # with strictly increasing new-text indentation so the closest match
+        # for a given indentation is a binary search away
+        template_new_lens: list[int] = []
+        template_old_indents: list[str] = []
 
         # Process each line with the appropriate indentation
         result_lines = []
         for i, new_line in enumerate(new_lines):
+            new_indent = new_indents[i]
             # Empty lines remain empty
-            if not new_line.strip():
+            if new_indent is None:
                 result_lines.append("")
                 continue
 
-            # Get current indentation in new text
-            new_indent = new_indents.get(i, "")
+            old_indent = old_indents[i] if i < len(old_indents) else None
 
             # Determine target indentation based on context
-            if i < len(old_lines) and i in old_indents:
+            if old_indent is not None:
                 # Matching line in old text - use its indentation
-                target_indent = old_indents[i]
+                target_indent = old_indent
             elif i == 0:
                 # First line gets base indentation
                 target_indent = base_indent
@@ -189,15 +312,12 @@ class EditFileTool(BaseTool):
 
                 # Find the closest previous line with appropriate indentation
                 # to use as template
-                for prev_i in range(i - 1, -1, -1):
-                    if prev_i in old_indents and prev_i in new_indents:
-                        prev_old = old_indents[prev_i]
-                        prev_new = new_indents[prev_i]
-                        if len(prev_new) <= curr_indent_len:
-                            # Add spaces to match the relative indentation
-                            relative_spaces = curr_indent_len - len(prev_new)
-                            target_indent = prev_old + " " * relative_spaces
-                            break
+                pos = bisect.bisect_right(template_new_lens, curr_indent_len)
+                if pos:
+                    # Add spaces to match the relative indentation
+                    prev_old = template_old_indents[pos - 1]
+                    relative_spaces = curr_indent_len - template_new_lens[pos - 1]
+                    target_indent = prev_old + " " * relative_spaces
             else:
                 # When first line has no indentation, use the new text's indentation
                 target_indent = new_indent
@@ -205,6 +325,16 @@ class EditFileTool(BaseTool):
             # Apply the calculated indentation
             result_lines.append(target_indent + new_line.lstrip())
 
+            if old_indent is not None:
+                # A later template with shorter or equal indentation shadows
+                # every earlier one it is not shorter than
+                new_indent_len = len(new_indent)
+                while template_new_lens and template_new_lens[-1] >= new_indent_len:
+                    template_new_lens.pop()
+                    template_old_indents.pop()
+                template_new_lens.append(new_indent_len)
+                template_old_indents.append(old_indent)
+
         return "\n".join(result_lines)
 
     def apply_edits(
@@ -212,7 +342,7 @@ class EditFileTool(BaseTool):
         content: str,
         edits: list[EditOperation],
         options: EditOptions,
-    ) -> tuple[str, list[MatchResult], bool]:
+    ) -> tuple[str, list[MatchResult], bool, tuple[int, int]]:
         """
         Apply a list of edit operations to the content.
 
@@ -222,7 +352,8 @@ class EditFileTool(BaseTool):
             options: Formatting options
 
         Returns:
-            Tuple of (modified content, list of match results, changes_made flag)
+            Tuple of (modified content, list of match results, changes_made flag,
+            lengths of the leading and trailing text left untouched by the edits)
         """
 
         # Normalize line endings
@@ -231,11 +362,16 @@ class EditFileTool(BaseTool):
         # Store match results for reporting
         match_results = []
         changes_made = False
+        unchanged_prefix = unchanged_suffix = len(normalized_content)
 
         # Process each edit
         for i, edit in enumerate(edits):
-            normalized_old = normalize_line_endings(edit.old_text)
-            normalized_new = normalize_line_endings(edit.new_text)
+            # Compare the raw texts first so no-op edits skip normalization
+            if edit.old_text == edit.new_text:
+                normalized_old = normalized_new = edit.old_text
+            else:
+                normalized_old = normalize_line_endings(edit.old_text)
+                normalized_new = normalize_line_endings(edit.new_text)
 
             # Skip if the replacement text is identical to the old text
             if normalized_old == normalized_new:
@@ -251,11 +387,13 @@ class EditFileTool(BaseTool):
                 )
                 continue
 
+            # Try exact match
+            exact_match = self.find_exact_match(
+                normalized_content, normalized_old, edit_index=i
+            )
+
             # Check if the new_text is already in the content
-            if (
-                normalized_new in normalized_content
-                and normalized_old not in normalized_content
-            ):
+            if not exact_match.matched and normalized_new in normalized_content:
                 match_results.append(
                     MatchResult(
                         matched=True,
@@ -268,15 +406,10 @@ class EditFileTool(BaseTool):
                 )
                 continue
 
-            # Try exact match
-            exact_match = self.find_exact_match(
-                normalized_content, normalized_old, edit_index=i
-            )
-
             # Process exact match (if found)
             if exact_match.matched:
-                # For exact matches, find position in content
-                start_pos = normalized_content.find(normalized_old)
+                # Reuse the position located by the exact match
+                start_pos = exact_match._start_pos
                 end_pos = start_pos + len(normalized_old)
 
                 # Apply indentation preservation if requested
@@ -285,24 +418,36 @@ class EditFileTool(BaseTool):
                         normalized_old, normalized_new
                     )
 
+                unchanged_prefix = min(unchanged_prefix, start_pos)
+                unchanged_suffix = min(
+                    unchanged_suffix, len(normalized_content) - end_pos
+                )
+
                 # Apply the edit
                 normalized_content = (
                     normalized_content[:start_pos]
                     + normalized_new
                     + normalized_content[end_pos:]
                 )
-                changes_made = True
+                # Indentation preservation may turn the replacement back into
+                # the text it replaces
+                if normalized_new != normalized_old:
+                    changes_made = True
 
             match_results.append(exact_match)
 
-        return normalized_content, match_results, changes_made
+        return (
+            normalized_content,
+            match_results,
+            changes_made,
+            (unchanged_prefix, unchanged_suffix),
+        )
 
     def _entrypoint(self, input: EditFileInput) -> TextContent:
         file_path = input.path
-        # Read file content
+        # Read file content with line endings already normalized
         try:
-            with open(file_path, encoding="utf-8") as f:
-                original_content = f.read()
+            normalized_original = read_text(file_path)
         except UnicodeDecodeError as e:
             raise ValueError(
                 f"Unicode decode error while reading {file_path}: {str(e)}"
@@ -317,8 +462,8 @@ class EditFileTool(BaseTool):
         match_results = []
 
         # Apply edits
-        modified_content, match_results, changes_made = self.apply_edits(
-            original_content, edit_operations, edit_options
+        modified_content, match_results, changes_made, unchanged_span = (
+            self.apply_edits(normalized_original, edit_operations, edit_options)
         )
 
         # Check for actual failures and already applied edits
@@ -352,15 +497,25 @@ class EditFileTool(BaseTool):
 
             return TextContent(type="text", text=result.model_dump_json(indent=2))
 
-        # Case 3: Changes needed - create diff
-        diff = self.create_unified_diff(original_content, modified_content, file_path)
+        # Case 3: Changes needed - create diff around the edited region only
+        unchanged_prefix, unchanged_suffix = unchanged_span
+        diff = self.create_unified_diff(
+            normalized_original,
+            modified_content,
+            file_path,
+            unchanged_prefix=unchanged_prefix,
+            unchanged_suffix=unchanged_suffix,
+        )
         result.diff = diff
         result.success = True
         if input.dry_run and changes_made:
             return TextContent(type="text", text=result.model_dump_json(indent=2))
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(modified_content)
+            if os.linesep != "\n":
+                modified_content = modified_content.replace("\n", os.linesep)
+            encoded_content = modified_content.encode("utf-8")
+            with open(file_path, "wb") as f:
+                f.write(encoded_content)
         except UnicodeEncodeError as e:
             result.success = False
             result.message = (
@@ -9,6 +9,8 @@ from core.types import BaseTool
 class GetAllowedPathsInput(BaseModel): ...
 
 
+_INPUT_SCHEMA = GetAllowedPathsInput.model_json_schema()
+
 TOOL_DESCRIPTION = f"""
     Get a detailed listing of all files and directories in a specified path.
     Results clearly distinguish between files and directories with [FILE] and [DIR]
@@ -18,14 +20,14 @@ TOOL_DESCRIPTION = f"""
         path: The path to the file to read.
     @Output:
         text: text with list of files/dir names.
-    @Schema: {GetAllowedPathsInput.model_json_schema()}
+    @Schema: {_INPUT_SCHEMA}
 """
 
 
 class GetAllowedPathsTool(BaseTool):
     def __init__(self):
         super().__init__(
-            inputSchema=GetAllowedPathsInput.model_json_schema(),
+            inputSchema=_INPUT_SCHEMA,
             name=FileSystemTools.GET_ALLOWED_PATHS.value,
             description=TOOL_DESCRIPTION,
         )
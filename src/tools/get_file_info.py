@@ -1,4 +1,6 @@
+import json
 import os
+import stat
 from datetime import datetime
 from typing import Annotated
 
@@ -14,14 +16,7 @@ class GetFileInfoInput(BaseModel):
     path: Annotated[str, AfterValidator(validate_path)]
 
 
-class FileStats(BaseModel):
-    size:float
-    created: datetime
-    modified: datetime
-    accessed: datetime
-    is_directory: bool
-    is_file: bool
-    permissions: str
+_INPUT_SCHEMA = GetFileInfoInput.model_json_schema()
 
 TOOL_DESCRIPTION = f"""
     Retrieve detailed metadata about a file or directory. Returns comprehensive
@@ -32,31 +27,33 @@ TOOL_DESCRIPTION = f"""
         path: file path to get stats.
     @Output:
         text: stats of file/dir including permissions.
-    @Schema: {GetFileInfoInput.model_json_schema()}
+    @Schema: {_INPUT_SCHEMA}
 """
 
 
 class GetFileInfoTool(BaseTool):
     def __init__(self):
         super().__init__(
-            inputSchema=GetFileInfoInput.model_json_schema(),
+            inputSchema=_INPUT_SCHEMA,
             name=FileSystemTools.GET_FILE_INFO.value,
             description=TOOL_DESCRIPTION,
         )
 
     def _entrypoint(self, input: GetFileInfoInput) -> TextContent:
         raw_stats = os.stat(input.path)
-        file_stats = FileStats(
-            size=raw_stats.st_size,
-            created=datetime.fromtimestamp(raw_stats.st_ctime),
-            modified=datetime.fromtimestamp(raw_stats.st_mtime),
-            accessed=datetime.fromtimestamp(raw_stats.st_atime),
-            is_directory=os.path.isdir(input.path),
-            is_file=os.path.isfile(input.path),
-            permissions=oct(raw_stats.st_mode)[-3:]
-        )
+        # Same fields and formatting the FileStats model used to serialize,
+        # with the file type read from the stat result already fetched
+        file_stats = {
+            "size": float(raw_stats.st_size),
+            "created": datetime.fromtimestamp(raw_stats.st_ctime).isoformat(),
+            "modified": datetime.fromtimestamp(raw_stats.st_mtime).isoformat(),
+            "accessed": datetime.fromtimestamp(raw_stats.st_atime).isoformat(),
+            "is_directory": stat.S_ISDIR(raw_stats.st_mode),
+            "is_file": stat.S_ISREG(raw_stats.st_mode),
+            "permissions": format(raw_stats.st_mode & 0o777, "03o"),
+        }
 
         return TextContent(
             type="text",
-            text=file_stats.model_dump_json(indent=2),
+            text=json.dumps(file_stats, indent=2),
         )
@@ -13,6 +13,8 @@ class ListDirectoryInput(BaseModel):
     path: Annotated[str, AfterValidator(validate_path)]
 
 
+_INPUT_SCHEMA = ListDirectoryInput.model_json_schema()
+
 TOOL_DESCRIPTION = f"""
     Get a detailed listing of all files and directories in a specified path.
     Results clearly distinguish between files and directories with [FILE] and [DIR]
@@ -22,25 +24,26 @@ TOOL_DESCRIPTION = f"""
         path: The path to the file to read.
     @Output:
         text: text with list of files/dir names.
-    @Schema: {ListDirectoryInput.model_json_schema()}
+    @Schema: {_INPUT_SCHEMA}
 """
 
 
 class ListDirectoryTool(BaseTool):
     def __init__(self):
         super().__init__(
-            inputSchema=ListDirectoryInput.model_json_schema(),
+            inputSchema=_INPUT_SCHEMA,
             name=FileSystemTools.LIST_DIRECTORY.value,
             description=TOOL_DESCRIPTION,
         )
 
     def _entrypoint(self, input: ListDirectoryInput) -> TextContent:
-        entries = os.scandir(input.path)
+        with os.scandir(input.path) as entries:
+            lines = [
+                "[DIR] " + entry.name if entry.is_dir() else "[FILE] " + entry.name
+                for entry in entries
+            ]
 
-        formatted = "\n".join(
-            f"[DIR] {entry.name}" if entry.is_dir() else f"[FILE] {entry.name}"
-            for entry in entries
-        )
+        formatted = "\n".join(lines)
 
         return TextContent(
             type="text",
@@ -1,4 +1,3 @@
-import datetime
 import os
 from enum import Enum
 from typing import Annotated
@@ -21,6 +20,10 @@ class ListDirectoryWithSizeInput(BaseModel):
     sort_by: SortByEnum = SortByEnum.file_name
 
 
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+_INPUT_SCHEMA = ListDirectoryWithSizeInput.model_json_schema()
+
 TOOL_DESCRIPTION = f"""
     Get a detailed listing of all files and directories in a specified path, including 
     sizes. Results clearly distinguish between files and directories with [FILE] 
@@ -31,83 +34,81 @@ TOOL_DESCRIPTION = f"""
         sort_by: string literal to file_name or size
     @Output:
         text: with sorted dir/files names plus summary.
-    @Schema: {ListDirectoryWithSizeInput.model_json_schema()}
+    @Schema: {_INPUT_SCHEMA}
 """
 
 
 class ListDirectoryWithSizeTool(BaseTool):
     def __init__(self):
         super().__init__(
-            inputSchema=ListDirectoryWithSizeInput.model_json_schema(),
+            inputSchema=_INPUT_SCHEMA,
             name=FileSystemTools.LIST_DIRECTORY_WITH_SIZE.value,
             description=TOOL_DESCRIPTION,
         )
 
     def _format_size(self, size_bytes: float):
         """Format size in bytes to human-readable form."""
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} PB"
-
-    def _sort_entries(self, detailed_entries: list[dict], sort_by: SortByEnum):
+        # Each unit is 2**10 times the previous one
+        unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(_UNITS) - 1)
+        if unit_index <= 0:
+            return f"{size_bytes:.2f} B"
+        return f"{size_bytes / (1 << (10 * unit_index)):.2f} {_UNITS[unit_index]}"
+
+    def _sort_entries(
+        self, names: list[str], sizes: list[int], sort_by: SortByEnum
+    ) -> list[int]:
+        """Return entry indices in display order."""
         if sort_by == SortByEnum.size:
-            return sorted(detailed_entries, key=lambda e: e["size"], reverse=True)
-
-        return sorted(detailed_entries, key=lambda e: e["name"].lower())
-
-    def _format_entry(self, entry_path: str, entry: os.DirEntry[str]):
-        try:
-            stats = os.stat(entry_path)
-            return {
-                "name": entry.name,
-                "isDirectory": entry.is_dir(),
-                "size": stats.st_size,
-                "mtime": datetime.datetime.fromtimestamp(stats.st_mtime),
-            }
-        except Exception:
-            return {
-                "name": entry.name,
-                "isDirectory": entry.is_dir(),
-                "size": 0,
-                "mtime": datetime.datetime.fromtimestamp(0),
-            }
-
-    def _format_output(self, sorted_entries: list[dict]):
+            return sorted(range(len(sizes)), key=sizes.__getitem__, reverse=True)
+
+        return sorted(range(len(names)), key=lambda i: names[i].lower())
+
+    def _scan_entries(self, path: str) -> tuple[list[str], list[bool], list[int]]:
+        """Collect names, directory flags and sizes as parallel lists."""
+        names = []
+        is_dirs = []
+        sizes = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                names.append(entry.name)
+                is_dirs.append(entry.is_dir())
+                try:
+                    sizes.append(entry.stat().st_size)
+                except Exception:
+                    sizes.append(0)
+        return names, is_dirs, sizes
+
+    def _format_output(
+        self,
+        names: list[str],
+        is_dirs: list[bool],
+        sizes: list[int],
+        order: list[int],
+    ):
         formatted_entries = []
-        for entry in sorted_entries:
-            kind = "[DIR]" if entry["isDirectory"] else "[FILE]"
-            name_padded = entry["name"].ljust(30)
+        for i in order:
+            kind = "[DIR]" if is_dirs[i] else "[FILE]"
+            name_padded = names[i].ljust(30)
             size_str = ""
-            if not entry["isDirectory"]:
-                size_str = self._format_size(entry["size"]).rjust(10)
+            if not is_dirs[i]:
+                size_str = self._format_size(sizes[i]).rjust(10)
 
             formatted_entries.append(f"{kind} {name_padded}{size_str}")
         return formatted_entries
 
     def _entrypoint(self, input: ListDirectoryWithSizeInput) -> TextContent:
-        valid_path = input.path
-        with os.scandir(valid_path) as entries:
-            detailed_entries = [
-                self._format_entry(
-                    os.path.join(valid_path, entry.name),
-                    entry,
-                )
-                for entry in entries
-            ]
-
-        sorted_entries = self._sort_entries(
-            detailed_entries=detailed_entries, 
-            sort_by=input.sort_by
-        )
+        names, is_dirs, sizes = self._scan_entries(input.path)
+
+        order = self._sort_entries(names=names, sizes=sizes, sort_by=input.sort_by)
         # Format output
-        formatted_entries = self._format_output(sorted_entries)
+        formatted_entries = self._format_output(names, is_dirs, sizes, order)
 
         # Summary
-        total_files = sum(1 for e in detailed_entries if not e["isDirectory"])
-        total_dirs = sum(1 for e in detailed_entries if e["isDirectory"])
-        total_size = sum(e["size"] for e in detailed_entries if not e["isDirectory"])
+        total_dirs = sum(is_dirs)
+        total_files = len(is_dirs) - total_dirs
+        total_size = sum(
+            size for size, is_dir in zip(sizes, is_dirs) if not is_dir
+        )
 
         summary = [
             "",
@@ -4,6 +4,7 @@ from mcp.types import TextContent
 from pydantic import AfterValidator, BaseModel
 
 from core.enums import FileSystemTools
+from core.files import read_text
 from core.types import BaseTool
 from core.validations import validate_path
 
@@ -11,25 +12,26 @@ from core.validations import validate_path
 class ReadFileInput(BaseModel):
     path: Annotated[str, AfterValidator(validate_path)]
 
+_INPUT_SCHEMA = ReadFileInput.model_json_schema()
+
 TOOL_DESCRIPTION = f"""
     Reads a file from the filesystem and returns its content.
     @Input:
         input: The path to the file to read.
     @Output:
         text: The content of the file.
-    @Schema: {ReadFileInput.model_json_schema()}
+    @Schema: {_INPUT_SCHEMA}
 """
 
 class ReadFileTool(BaseTool):
     def __init__(self):
         super().__init__(
-            inputSchema=ReadFileInput.model_json_schema(),
+            inputSchema=_INPUT_SCHEMA,
             name=FileSystemTools.READ_FILE.value,
             description=TOOL_DESCRIPTION,
         )
 
     def _entrypoint(self, input: ReadFileInput) -> TextContent:
-        with open(input.path, encoding="utf-8") as file:
-            content = file.read()
+        content = read_text(input.path)
         return TextContent(type="text", text=f"{input.path}:\n{content}")
    
\ No newline at end of file
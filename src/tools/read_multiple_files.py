@@ -1,43 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from mcp.types import TextContent
 from pydantic import BaseModel
 
 from core.enums import FileSystemTools
+from core.files import read_text
 from core.types import BaseTool
 from core.validations import validate_path
 
+# Upper bound on files read concurrently
+_MAX_READ_WORKERS = 8
+
 
 class ReadMultipleFilesInput(BaseModel):
     paths: list[str]
 
+_INPUT_SCHEMA = ReadMultipleFilesInput.model_json_schema()
+
 TOOL_DESCRIPTION = f"""
     Reads multiple files from the filesystem and returns their content.
     @Input:
         paths: A list of paths to the files to read.
     @Output:
         text: A list of strings, each containing the content of a file.
-    @Schema: {ReadMultipleFilesInput.model_json_schema()}
+    @Schema: {_INPUT_SCHEMA}
 """
 class ReadMultipleFilesTool(BaseTool):
 
     def __init__(self):
         super().__init__(
-            inputSchema=ReadMultipleFilesInput.model_json_schema(),
+            inputSchema=_INPUT_SCHEMA,
             name=FileSystemTools.READ_MULTIPLE_FILES.value,
             description=TOOL_DESCRIPTION,
         )
     
     def _entrypoint(self, input: ReadMultipleFilesInput) -> list[TextContent]:
-        results = []
-        for path in input.paths:
-            result = self._read_file(path)
-            results.append(result)
-        return results
+        if len(input.paths) < 2:
+            return [self._read_file(path) for path in input.paths]
+
+        # File reads release the GIL, so their latencies overlap across threads
+        workers = min(_MAX_READ_WORKERS, len(input.paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._read_file, input.paths))
 
     def _read_file(self, path: str) -> TextContent:
         try:
             valid_path = validate_path(path)
-            with open(valid_path, encoding="utf-8") as file:
-                content = file.read()
+            content = read_text(valid_path)
             return TextContent(type="text", text=f"{path}:\n{content}")
         except Exception as e:
             return TextContent(
@@ -1,5 +1,6 @@
+import fnmatch
 import os
-from fnmatch import fnmatch
+import re
 from typing import Annotated
 
 from mcp.types import TextContent
@@ -16,6 +17,8 @@ class SearchFilesInput(BaseModel):
     exclude_patterns: list[str] = []
 
 
+_INPUT_SCHEMA = SearchFilesInput.model_json_schema()
+
 TOOL_DESCRIPTION = f"""
     Recursively search for files and directories matching a pattern.
     Searches through all subdirectories from the starting path. The search
@@ -28,14 +31,14 @@ TOOL_DESCRIPTION = f"""
         exclude_patterns: paths to exclude searching
     @Output:
         text: text with success message or error
-    @Schema: {SearchFilesInput.model_json_schema()}
+    @Schema: {_INPUT_SCHEMA}
 """
 
 
 class SearchFilesTool(BaseTool):
     def __init__(self):
         super().__init__(
-            inputSchema=SearchFilesInput.model_json_schema(),
+            inputSchema=_INPUT_SCHEMA,
             name=FileSystemTools.SEARCH_FILES.value,
             description=TOOL_DESCRIPTION,
         )
@@ -48,50 +51,77 @@ class SearchFilesTool(BaseTool):
     def _search_files(
         self,
         root_path: str,
-        pattern: str,
+        pattern_lower: str,
         exclude_patterns: list[str],
     ):
         results = []
-
-        def search(current_path: str):
-            try:
-                entries = os.scandir(current_path)
-            except Exception:
-                return  # Skip unreadable directories
-
-            with entries:
-                for entry in entries:
-                    full_path = os.path.join(current_path, entry.name)
-
-                    try:
-                        self._validate_path(full_path)
-                        relative_path = os.path.relpath(full_path, root_path)
-
-                        # Handle exclusion patterns (converted to glob-style)
-                        should_exclude = any(
-                            fnmatch(relative_path, p) or fnmatch(full_path, p)
-                            for p in exclude_patterns
-                        )
-                        if should_exclude:
+        root_prefix_len = len(root_path.rstrip(os.sep)) + 1
+        # Translate the glob patterns once instead of per entry
+        exclude_matchers = [
+            re.compile(fnmatch.translate(os.path.normcase(p))).match
+            for p in exclude_patterns
+        ]
+
+        try:
+            root_entries = os.scandir(root_path)
+        except Exception:
+            return results  # Skip unreadable directories
+
+        # Open directory iterators, innermost last, so results keep
+        # depth-first order without recursion
+        stack = [root_entries]
+        try:
+            while stack:
+                try:
+                    entry = next(stack[-1], None)
+                except OSError:
+                    entry = None  # Skip the rest of an unreadable directory
+                if entry is None:
+                    stack.pop().close()
+                    continue
+
+                # Entries of a scandir(path) iterator are path + sep + name
+                full_path = entry.path
+
+                try:
+                    # scandir already proves the entry exists; only a
+                    # symlink can point at nothing
+                    if entry.is_symlink() and not os.path.exists(full_path):
+                        continue
+
+                    # Handle exclusion patterns (converted to glob-style)
+                    if exclude_matchers:
+                        relative_path = full_path[root_prefix_len:]
+                        relative_case = os.path.normcase(relative_path)
+                        full_case = os.path.normcase(full_path)
+                        if any(
+                            match(relative_case) or match(full_case)
+                            for match in exclude_matchers
+                        ):
                             continue
 
-                        if pattern.lower() in entry.name.lower():
-                            results.append(full_path)
-
-                        if entry.is_dir():
-                            search(full_path)
-                    except Exception:
-                        continue  # Skip errors on individual entries
+                    name_lower = entry.name.lower()
+                    if pattern_lower in name_lower:
+                        results.append(full_path)
+
+                    if entry.is_dir(follow_symlinks=False):
+                        try:
+                            stack.append(os.scandir(full_path))
+                        except Exception:
+                            continue  # Skip unreadable directories
+                except Exception:
+                    continue  # Skip errors on individual entries
+        finally:
+            for entries in stack:
+                entries.close()
 
-        search(root_path)
         return results
-        
 
     def _entrypoint(self, input: SearchFilesInput) -> TextContent:
         root_path = self._validate_path(input.path)
         results = self._search_files(
             root_path=root_path,
-            pattern=input.pattern,
+            pattern_lower=input.pattern.lower(),
             exclude_patterns=input.exclude_patterns,
         )
 
@@ -18,20 +18,22 @@ class WriteFileInput(BaseModel):
     content: str
 
 
+_INPUT_SCHEMA = WriteFileInput.model_json_schema()
+
 TOOL_DESCRIPTION = f"""
     Writes content to a file on the filesystem.
     @Input:
         path: The path to the file to write to.
     @Output:
         text: A message indicating the success of the operation.
-    @Schema: {WriteFileInput.model_json_schema()}
+    @Schema: {_INPUT_SCHEMA}
 """
 
 class WriteFileTool(BaseTool):
 
     def __init__(self):
         super().__init__(
-            inputSchema=WriteFileInput.model_json_schema(),
+            inputSchema=_INPUT_SCHEMA,
             name=FileSystemTools.WRITE_FILE.value,
             description=TOOL_DESCRIPTION,
         )